@@ -1,4 +1,27 @@
-from .api import Api
-from .account import Account, Accounts
-from .alias import Alias, Aliases
-from .spam import Spam, ACL, Settings
+import importlib
+
+# The Api classes pull in requests, urllib3 and colorama.  Import them on
+# first use, so light helpers like `rackspace.serialize` (used by split.py)
+# stay cheap to import
+_EXPORTS = {
+    'Api': '.api',
+    'Account': '.account',
+    'Accounts': '.account',
+    'Alias': '.alias',
+    'Aliases': '.alias',
+    'Spam': '.spam',
+    'ACL': '.spam',
+    'Settings': '.spam',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -20,10 +20,6 @@ class DuplicateLoadError(Exception):
     pass
 
 
-class RetrieveLimit(Exception):
-    pass
-
-
 class Account(object):
     """Account object with all knowledge for a single account
 
@@ -470,22 +466,33 @@ class Accounts(object):
 
         path = f'{self.api._accounts_path()}/'
 
+        # Number of accounts left to retrieve, None for no limit
+        remaining = limit if isinstance(limit, int) else None
+
         while True:
             response = self.api.get(path, *pargs, **kwargs)
             assert response.status_code == 200 and response.text
             data = response.json()
 
-            try:
-                for account_meta in data['rsMailboxes']:
-                    if isinstance(limit, int) and len(accounts) >= limit:
-                        raise RetrieveLimit
+            # If we specified a limit to retrieve, only take what is left of it
+            entries = data['rsMailboxes']
+            if remaining is not None:
+                entries = entries[:remaining]
+                remaining -= len(entries)
+
+            # Retrieve the full account data for the whole page at once
+            paths = [self.api._account_path(account_meta['name']) for account_meta in entries]
+            for account_meta, account_response in zip(entries, self.api.get_many(paths)):
+                account_data = None
+                if self.api._success(account_response):
+                    account_data = account_response.json()
 
-                    account = Account(account_meta['name'], api=self.api, debug=self.debug).get()
-                    assert account is not None
+                account = Account(account_meta['name'], api=self.api, data=account_data, response=account_response, debug=self.debug)
 
-                    accounts.update({account.name.lower(): account})
+                accounts.update({account.name.lower(): account})
 
-            except RetrieveLimit:
+            # If we hit the limit, break the main loop
+            if remaining is not None and remaining <= 0:
                 break
 
             # If this is the last page of info, break the main loop
@@ -21,10 +21,6 @@ class DuplicateLoadError(Exception):
     pass
 
 
-class RetrieveLimit(Exception):
-    pass
-
-
 class Alias(object):
     """Alias object with all knowledge for a single alias
 
@@ -177,10 +173,14 @@ class Alias(object):
         # and what is old, to remove
         diff: dict = {'add': [], 'del': [], 'old': other_alias.data, 'new': self.data, 'changes': 0}
 
+        # Use a set for the membership tests, large aliases (mailing lists)
+        # would otherwise scan both lists for every address
         for src, dst, key in ((self, other_alias, 'add'), (other_alias, self, 'del')):
+            skip = set(dst.data)
             for address in src.data:
-                if address not in dst.data and address not in diff[key]:
+                if address not in skip:
                     diff[key].append(address)
+                    skip.add(address)
                     diff['changes'] += 1
 
         return diff
@@ -361,34 +361,37 @@ class Aliases(object):
 
         path = f'{self.api._aliases_path()}/'
 
+        # Number of aliases left to retrieve, None for no limit
+        remaining = limit if isinstance(limit, int) else None
+
         while True:
             response = self.api.get(path, *pargs, **kwargs)
             assert response.status_code == 200 and response.text
             data = response.json()
 
-            try:
-                for alias in data['aliases']:
-
-                    # If we specified a limit to retrieve, disable the outer loop and
-                    if isinstance(limit, int) and len(aliases) >= limit:
-                        raise RetrieveLimit
+            # If we specified a limit to retrieve, only take what is left of it
+            entries = data['aliases']
+            if remaining is not None:
+                entries = entries[:remaining]
+                remaining -= len(entries)
 
-                    alias_obj = Alias(alias['name'], api=self.api, debug=self.debug)
+            for alias in entries:
+                alias_obj = Alias(alias['name'], api=self.api, debug=self.debug)
 
-                    # If target is a single address, we have all the info needed
-                    if alias['numberOfMembers'] == 1:
-                        alias_obj.load(data=alias)
+                # If target is a single address, we have all the info needed
+                if alias['numberOfMembers'] == 1:
+                    alias_obj.load(data=alias)
 
-                    # If there are more than 1 target, we don't have the addresses
-                    # and have to call the api to load the members instead
-                    elif alias['numberOfMembers'] > 1:
-                        alias_obj = alias_obj.get() # type: ignore
+                # If there are more than 1 target, we don't have the addresses
+                # and have to call the api to load the members instead
+                elif alias['numberOfMembers'] > 1:
+                    alias_obj = alias_obj.get() # type: ignore
 
-                    # Save the alias to our dictionary
-                    aliases.update({alias_obj.name.lower(): alias_obj})
+                # Save the alias to our dictionary
+                aliases.update({alias_obj.name.lower(): alias_obj})
 
             # If we hit the limit, break the main loop
-            except RetrieveLimit:
+            if remaining is not None and remaining <= 0:
                 break
 
             # If this is the last page of info, break the main loop
@@ -1,21 +1,182 @@
 from __future__ import annotations
 
 import base64
-import datetime
+import contextvars
+import functools
 import hashlib
 import http.client
 import json
 import logging
 import requests
+import sys
+import threading
 import time
-import yaml
 
-from typing import Optional, Tuple, Callable
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Deque, Dict, Optional, List, Tuple
+from urllib.parse import urlencode
 
 from colorama import Fore, Style
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional, decodes straight from bytes and is faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 API_URL: str = 'https://api.emailsrvr.com'
 RATE_LIMIT_WAIT = 5
+RATE_LIMIT_WINDOW = 60
+MAX_WORKERS = 8
+GET_CACHE_TTL = 30
+GET_CACHE_SIZE = 256
+
+# Retries for failed connections and transient gateway errors, with backoff.
+# Rate limiting (403) is handled by the rate_limit decorator instead
+CONNECT_RETRIES = 3
+CONNECT_BACKOFF = 0.2
+RETRY_STATUS = (502, 503, 504)
+
+METHOD_COLORS: Dict[str, str] = {
+        'GET': Fore.GREEN,
+        'PUT': Fore.YELLOW,
+        'POST': Fore.YELLOW,
+        'DELETE': Fore.RED,
+        }
+
+# Maximum concurrent requests in flight per rate limit bucket
+MAX_IN_FLIGHT: Dict[str, int] = {'get': MAX_WORKERS, 'send': 4}
+
+# AIMD adjustment of a bucket's allowed rate, added on success,
+# multiplied on a rate limit response
+RATE_INCREASE: float = 0.5
+RATE_DECREASE: float = 0.5
+
+# Slow down when X-RateLimit-Remaining drops below this fraction
+# of the bucket's limit, multiplying the allowed rate by RATE_SLOW_DOWN
+RATE_LOW_REMAINING: float = 0.1
+RATE_SLOW_DOWN: float = 0.8
+
+
+class _Bucket(object):
+    """Shared state of a rate limit bucket ('get', 'send')
+
+    Rackspace limits per API key, so buckets are shared by all Api objects.
+
+    Attributes:
+       max_rate (float): Published limit, calls per RATE_LIMIT_WINDOW seconds
+       rate (float): Currently allowed calls per RATE_LIMIT_WINDOW seconds
+       calls (deque): Timestamps of the calls made in the current window
+       in_flight (BoundedSemaphore): Caps concurrent requests
+    """
+    def __init__(self, rate: int, in_flight: int =1) -> None:
+        self.max_rate: float = float(rate)
+        self.min_rate: float = 1.0
+        self.rate: float = float(rate)
+        self.calls: Deque[float] = deque()
+        self.lock = threading.Lock()
+        self.in_flight = threading.BoundedSemaphore(in_flight)
+
+    def throttle(self) -> None:
+        """Block until a call is allowed
+
+        Sliding window limiter, allowing at most `rate` calls in any
+        RATE_LIMIT_WINDOW seconds
+
+        Args:
+
+        Returns:
+           None
+
+        Raises:
+           None
+        """
+        calls = self.calls
+        with self.lock:
+            while True:
+                now = time.monotonic()
+
+                # Forget calls that left the window
+                while calls and calls[0] <= now - RATE_LIMIT_WINDOW:
+                    calls.popleft()
+
+                if len(calls) < int(self.rate):
+                    break
+
+                # Wait for the oldest call to leave the window
+                time.sleep(calls[0] + RATE_LIMIT_WINDOW - now)
+
+            calls.append(now)
+
+    # NOTE: rate updates are not locked, a racing update
+    # only loses a single adjustment
+    def success(self) -> None:
+        """Additive increase of the allowed rate, up to `max_rate`"""
+        self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
+
+    def limited(self, factor: float =RATE_DECREASE) -> None:
+        """Multiplicative decrease of the allowed rate, down to `min_rate`"""
+        self.rate = max(self.min_rate, self.rate * factor)
+
+
+_BUCKETS: Dict[str, _Bucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def _bucket(_id: str, rate: int) -> _Bucket:
+    """Get the shared rate limit bucket `_id`, creating it if needed"""
+    with _BUCKETS_LOCK:
+        if _id not in _BUCKETS:
+            _BUCKETS[_id] = _Bucket(rate, MAX_IN_FLIGHT.get(_id, 1))
+
+        return _BUCKETS[_id]
+
+# (epoch second, formatted time stamp) of the last _now_ts() call
+_NOW_TS: Tuple[int, str] = (-1, '')
+
+def _now_ts() -> str:
+    """Current local time as 'YYYYmmddHHMMSS', formatted at most once per second"""
+    global _NOW_TS
+
+    now = int(time.time())
+    if _NOW_TS[0] != now:
+        _NOW_TS = (now, time.strftime('%Y%m%d%H%M%S', time.localtime(now)))
+
+    return _NOW_TS[1]
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+def _json_pretty(data: Any) -> str:
+    """Encode data as indented JSON with sorted keys, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+    return json.dumps(data, sort_keys=True, indent=4)
+
+def _header_float(response: requests.Response, header: str) -> Optional[float]:
+    """Numeric value of a response header, None if missing or not a number"""
+    try:
+        return float(response.headers.get(header))
+    except (TypeError, ValueError):
+        return None
+
+def _retry_after(response: requests.Response, default: float =RATE_LIMIT_WAIT) -> float:
+    """Seconds to wait before the next request
+
+    Uses the `Retry-After` header (seconds) when present, else `default`
+    """
+    wait = _header_float(response, 'Retry-After')
+    if wait is None:
+        return default
+
+    return max(wait, 0.0)
 
 # Note: Rackspace returns "403 Forbidden" for rate limit responses,
 # instead of the correct "429 Too Many Requests".
@@ -23,22 +184,41 @@ RATE_LIMIT_WAIT = 5
 # calls with the rate_limit decorator to pre-throttle the calls
 # and prevent the 403.
 def rate_limit(rate: int =90, _id: str =None):
-    def outer_wrapper(func, _id=_id):
-        if _id is None:
-            _id = func.__name__
+    def outer_wrapper(func):
+        name = _id if _id is not None else func.__name__
 
+        @functools.wraps(func)
         def inner_wrapper(*pargs, **kwargs):
+            bucket = _bucket(name, rate)
+
             while True:
-                response = func(*pargs, **kwargs)
+                bucket.throttle()
 
-                # Catch rate limit and repeat request
-                if response.status_code == 403 and response.text:
-                    msg = response.json()
+                # Queue here, instead of bursting threaded callers
+                # past the rate limit
+                with bucket.in_flight:
+                    response = func(*pargs, **kwargs)
+
+                # Catch rate limit and repeat request, should not happen
+                # now that calls are pre-throttled
+                if response is not None and response.status_code == 403 and response.text:
+                    msg = _json_loads(response.content)
                     if 'unauthorizedFault' in msg and msg['unauthorizedFault'].get('message', '') == 'Exceeded request limits':
-                        print(f'- ERROR: Rate Limit exceeded, sleeping {RATE_LIMIT_WAIT}, then retry')
-                        time.sleep(RATE_LIMIT_WAIT)
+                        bucket.limited()
+                        wait = _retry_after(response)
+                        Api._log.warning('Rate Limit exceeded, sleeping %s, then retry', wait)
+                        time.sleep(wait)
                         continue
 
+                # React to the rate limit headers, before we get refused
+                remaining = None if response is None else _header_float(response, 'X-RateLimit-Remaining')
+                if remaining is not None and remaining < bucket.max_rate * RATE_LOW_REMAINING:
+                    bucket.limited(RATE_SLOW_DOWN)
+                    time.sleep(_retry_after(response, 1))
+
+                else:
+                    bucket.success()
+
                 # Not rate limited, break the loop and return
                 break
 
@@ -54,6 +234,20 @@ class Api(object):
        customer (int): Rackspace customer #
        domain (str): Rackspace domain
     """
+    _log: logging.Logger = logging.getLogger('rackspace.api')
+
+    # Class wide switch to log the request trace and error bodies
+    # at INFO, instead of DEBUG, level.  See `set_verbose()`
+    verbose: ClassVar[bool] = False
+
+    # API root path templates, see `_path()`
+    _PATHS: ClassVar[Dict[str, str]] = {
+            'customer': '/v{ver}/customers/{customer}',
+            'domain': '/v{ver}/customers/{customer}/domains/{domain}',
+            'accounts': '/v{ver}/customers/{customer}/domains/{domain}/rs/mailboxes',
+            'aliases': '/v{ver}/customers/{customer}/domains/{domain}/rs/aliases',
+            }
+
     def __repr__(self):
         return f'{self.__class__.__name__}(user_key={self.user_key!r}, secret_key={self.secret_key!r}, customer_id={self.customer!r}, domain={self.domain!r})'
 
@@ -65,6 +259,7 @@ class Api(object):
             time_stamp: str = None,
             user_agent: str = None,
             domain: str = None,
+            cache_ttl: float = GET_CACHE_TTL,
             *pargs,
             **kwargs
             ) -> None:
@@ -78,8 +273,9 @@ class Api(object):
            customer_id (int, optional): Rackspace Customer #
            domain (str, optional): Rackspace domain
            api_url (str, optional): Rackspace API URL defaults {API_URL}
-           time_stamp (str, optional): Time Stamp used for API Token, defaults to `datetime.now`
+           time_stamp (str, optional): Time Stamp used for API Token, defaults to the current local time
            user_agent (str, optional): Web User Agent to report for API calls, defaults to `requests` standard UA
+           cache_ttl (float, optional): Seconds to cache successful `get` responses, 0 to disable, defaults {GET_CACHE_TTL}
 
         Returns:
            None
@@ -107,7 +303,7 @@ class Api(object):
         headers.update({'Accept': 'application/json'})
 
         if time_stamp is None:
-            time_stamp = '{:%Y%m%d%H%M%S}'.format(datetime.datetime.now())
+            time_stamp = _now_ts()
 
         self.headers: dict = headers
         self.time_stamp: str = time_stamp
@@ -118,6 +314,38 @@ class Api(object):
 
         self.token_sha: Optional[str] = None
         self.auth_token: Optional[str] = None
+        self._signed_time_stamp: Optional[str] = None
+        self._auth_lock = threading.Lock()
+
+        # user_key and user_agent lead the token hash and never change,
+        # hash them once and only add the time stamp and secret per token
+        self._sha1_prefix = hashlib.sha1(f'{user_key}{user_agent}'.encode())
+        self._secret_bytes: bytes = secret_key.encode()
+
+        # Keep connections alive between calls, instead of a new
+        # TCP connection and TLS handshake for every request
+        self._session: requests.Session = requests.Session()
+        # Only idempotent methods are retried on RETRY_STATUS, the final
+        # response is still returned to the caller rather than raised
+        retries = Retry(total=CONNECT_RETRIES, backoff_factor=CONNECT_BACKOFF,
+                        status_forcelist=RETRY_STATUS, raise_on_status=False)
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries))
+
+        # The session sends our static headers itself, the signature is
+        # passed per request, the shared dict is never changed after this
+        self._session.headers = self.headers
+
+        # Successful GET responses, {(pargs, kwargs): (monotonic time, response)},
+        # least recently used first, at most GET_CACHE_SIZE entries
+        self.cache_ttl: float = cache_ttl
+        self._get_cache: OrderedDict[tuple, Tuple[float, requests.Response]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Bumped by `clear_cache()`, a GET only stores its response if no
+        # write started or finished while it was in flight
+        self._cache_generation: int = 0
+
+        self._update_paths()
 
     @property
     def customer(self) -> str:
@@ -127,7 +355,9 @@ class Api(object):
             return None
     @customer.setter
     def customer(self, value: str) -> None:
-        self.__customer=value
+        # Stored as a string, it is only ever used to build paths
+        self.__customer = None if value is None else str(value)
+        self._update_paths()
 
     @property
     def domain(self) -> str:
@@ -138,6 +368,7 @@ class Api(object):
     @domain.setter
     def domain(self, value: str) -> None:
         self.__domain=value
+        self._update_paths()
 
     def set_domain(self, domain: str) -> None:
         """Sets API domain
@@ -151,7 +382,26 @@ class Api(object):
         Raises:
            None
         """
-        self.__domain = domain
+        self.domain = domain
+
+    def _update_paths(self) -> None:
+        """Cache the API v1 root paths
+
+        The root paths only depend on the customer and domain, so they are
+        rebuilt when either changes instead of on every request
+
+        Args:
+
+        Returns:
+           None
+
+        Raises:
+           None
+        """
+        self._paths_v1: Dict[str, str] = {
+                kind: template.format(ver=1, customer=self.customer, domain=self.domain)
+                for kind, template in self._PATHS.items()
+                }
 
     def gen_auth(self, new: bool =False, time_stamp: str =None) -> str:
         """Generate auth token for API calls
@@ -168,21 +418,23 @@ class Api(object):
         Raises:
            None
         """
-        if time_stamp is not None:
-            self.time_stamp = time_stamp
-            self._genTokenSha()
+        # Api objects are shared between threads, sign under the lock
+        with self._auth_lock:
+            if time_stamp is not None:
+                self.time_stamp = time_stamp
 
-        elif new:
-            self.time_stamp = '{:%Y%m%d%H%M%S}'.format(datetime.datetime.now())
-            self._genTokenSha()
+            elif new:
+                self.time_stamp = _now_ts()
 
-        elif self.token_sha is None:
-            self._genTokenSha()
+            # The token only depends on the time stamp (second granularity),
+            # so only sign again when it changed since the last token
+            if self.auth_token is None or self._signed_time_stamp != self.time_stamp:
+                self._genTokenSha()
+                self._signed_time_stamp = self.time_stamp
 
-        token = f'{self.user_key}:{self.time_stamp}:{self.token_sha}'
-        self.headers.update({'X-Api-Signature': token})
+                self.auth_token = f'{self.user_key}:{self.time_stamp}:{self.token_sha}'
 
-        return token
+            return self.auth_token
 
     def _genTokenSha(self) -> str:
         """Generate the Auth Token SHA hash
@@ -195,9 +447,8 @@ class Api(object):
         Raises:
            None
         """
-        base_str = f'{self.user_key}{self.user_agent}{self.time_stamp}{self.secret_key}'
-
-        sha1 = hashlib.sha1(base_str.encode())
+        sha1 = self._sha1_prefix.copy()
+        sha1.update(b''.join((str(self.time_stamp).encode(), self._secret_bytes)))
 
         b64 = base64.b64encode(sha1.digest())
 
@@ -206,62 +457,124 @@ class Api(object):
         return self.token_sha
 
     @staticmethod
-    def _params(*pargs, **kwargs) -> Tuple[dict, str]:
+    def _params(*pargs, **kwargs) -> dict:
         """Create a shallow copy of kwargs
 
-        Creates a shallow copy of kwargs and data for debug
-
         Args:
 
         Returns:
            dict: shallow copy of `**kwargs`
-           str: URL args string (for debug output)
 
         Raises:
            None
         """
-        args = ''
-        params = {}
-        for k,v in kwargs.items():
-            params.update({k: v})
-            sep = '?' if args else '&'
-            args = f'{args}{sep}{k}={v}'
+        return dict(kwargs)
 
-        return params, args
+    def get(self, *pargs, no_cache: bool =False, **kwargs) -> requests.Response:
+        """API: `get` data from the rackspace API
 
-    def _headers(self) -> dict:
-        """Get the API headers
+        Requests data from the Rackspace API, ensuring we don't exceed our `get` rate limit
 
-        Returns the API HTTP headers for a call
+        Successful responses are cached for `cache_ttl` seconds, up to
+        GET_CACHE_SIZE of them, any `put`, `post` or `delete` clears the
+        cache.  Calls with unhashable arguments are never cached
 
         Args:
+           path (str): API path to request
+           no_cache (bool, optional): True to bypass the response cache
 
         Returns:
-           dict: HTTP Headers
+           requests.Response: Response for the GET call
 
         Raises:
            None
         """
-        self.gen_auth()
+        if no_cache or self.cache_ttl <= 0:
+            return self._get(*pargs, **kwargs)
 
-        return self.headers
+        try:
+            key = (pargs, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # e.g. data={...} or list query params, just don't cache them
+            return self._get(*pargs, **kwargs)
 
-    @rate_limit(120)
-    def get(self, *pargs, **kwargs) -> requests.Response:
-        """API: `get` data from the rackspace API
+        with self._cache_lock:
+            cached = self._get_cache.get(key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.cache_ttl:
+                    self._get_cache.move_to_end(key)
+                    return cached[1]
 
-        Requests data from the Rackspace API, ensuring we don't exceed our `get` rate limit
+                del self._get_cache[key]
+
+            generation = self._cache_generation
+
+        response = self._get(*pargs, **kwargs)
+
+        if self._success(response, output=False) and 'no-store' not in response.headers.get('Cache-Control', ''):
+            with self._cache_lock:
+                # A write happened meanwhile, this response may predate it
+                if generation != self._cache_generation:
+                    return response
+
+                now = time.monotonic()
+                self._get_cache[key] = (now, response)
+                self._get_cache.move_to_end(key)
+
+                if len(self._get_cache) > GET_CACHE_SIZE:
+                    # Full, drop the expired entries first, then the least recently used
+                    for old in [k for k, (stamp, _) in self._get_cache.items() if now - stamp >= self.cache_ttl]:
+                        del self._get_cache[old]
+
+                    while len(self._get_cache) > GET_CACHE_SIZE:
+                        self._get_cache.popitem(last=False)
+
+        return response
+
+    @rate_limit(120, 'get')
+    def _get(self, *pargs, **kwargs) -> requests.Response:
+        """API: Uncached `get`, see `get()`"""
+        return self.__send('GET', *pargs, **kwargs)
+
+    def clear_cache(self) -> None:
+        """Drop all cached `get` responses
 
         Args:
-           path (str): API path to request
 
         Returns:
-           requests.Response: Response for the GET call
+           None
 
         Raises:
            None
         """
-        return self.__send(requests.get, *pargs, **kwargs)
+        with self._cache_lock:
+            self._get_cache.clear()
+            self._cache_generation += 1
+
+    def get_many(self, paths: List[str], *pargs, **kwargs) -> List[requests.Response]:
+        """API: `get` several paths from the rackspace API concurrently
+
+        Overlaps the round trips of independent GET requests using a small
+        thread pool.  Each request still goes through `get()`, so the rate
+        limit handling is unchanged.
+
+        Args:
+           paths (list): API paths to request
+
+        Returns:
+           list: requests.Response for each path, in the same order as `paths`
+
+        Raises:
+           None
+        """
+        if len(paths) < 2:
+            return [self.get(path, *pargs, **kwargs) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as pool:
+            # Each request runs in a copy of the caller's context
+            return list(pool.map(lambda ctx, path: ctx.run(self.get, path, *pargs, **kwargs),
+                                 [contextvars.copy_context() for _ in paths], paths))
 
     @rate_limit(90, 'send')
     def put(self, *pargs, **kwargs) -> requests.Response:
@@ -281,7 +594,7 @@ class Api(object):
         Raises:
            None
         """
-        return self.__send(requests.put, *pargs, **kwargs)
+        return self.__send('PUT', *pargs, **kwargs)
 
     @rate_limit(90, 'send')
     def post(self, *pargs, **kwargs) -> requests.Response:
@@ -301,16 +614,16 @@ class Api(object):
         Raises:
            None
         """
-        return self.__send(requests.post, *pargs, **kwargs)
+        return self.__send('POST', *pargs, **kwargs)
 
-    def __send(self, func: Callable, path: str, data: dict =None, *pargs, **kwargs) -> requests.Response:
+    def __send(self, method: str, path: str, data: dict =None, *pargs, **kwargs) -> requests.Response:
         """API: Private method for `get`, `put`, `post`, and `delete`
 
         Private method to do the work of `get`, `put`, `post`, and `delete`, as they are basically identical
         in how they are called
 
         Args:
-           func (function): `request.put` or `request.post` function
+           method (str): HTTP method, 'GET', 'PUT', 'POST' or 'DELETE'
            path (str): API path for this request
            data (dict) Data to be sent to the API
 
@@ -322,25 +635,30 @@ class Api(object):
         """
         URL = self._url(path)
 
-        params, args = self._params(*pargs, **kwargs)
-        fname = func.__name__.upper()
-        color = ''
-        if fname == 'GET':
-            color = Fore.GREEN
-        elif fname == 'PUT':
-            color = Fore.YELLOW
-        elif fname == 'POST':
-            color = Fore.YELLOW
-        elif fname == 'DELETE':
-            color = Fore.RED
-        fname = f'{color}{fname}{Style.RESET_ALL}'
+        params = self._params(*pargs, **kwargs)
 
-        print('{} {}'.format(fname, ''.join((URL,args))))
+        # Anything we change could be in a cached response
+        if method != 'GET':
+            self.clear_cache()
 
-        return func(URL, data=data, headers=self._headers(), params=params)
+        # Only build the trace line when someone is listening
+        level = logging.INFO if self.verbose else logging.DEBUG
+        if self._log.isEnabledFor(level):
+            args = f'?{urlencode(params)}' if params else ''
+            self._log.log(level, '%s%s%s %s%s', METHOD_COLORS.get(method, ''), method, Style.RESET_ALL, URL, args)
 
-    @rate_limit(90, 'send')
-    def delete(self, *pargs, **kwargs) -> requests.Response:
+        auth = {'X-Api-Signature': self.gen_auth()}
+
+        response = self._session.request(method, URL, data=data, params=params, headers=auth)
+
+        # Again once the write is done, GETs sent while it ran may have
+        # seen the old state
+        if method != 'GET':
+            self.clear_cache()
+
+        return response
+
+    def delete(self, *pargs, **kwargs) -> Optional[requests.Response]:
         """API: Delete resource from Rackspace
 
         Delete the resource from the Rackspace API, ensuring we do not exceed
@@ -352,16 +670,21 @@ class Api(object):
         Args:
 
         Returns:
-           requests.Response: Response for the DELETE call
+           requests.Response: Response for the DELETE call, None if not confirmed
 
         Raises:
            None
         """
-        while input(f"\n{pargs[0]}\nAre you sure you wish to delete (Yes/No)? ").lower() in ('y', 'yes'):
-          return self.__send(requests.delete, *pargs, **kwargs)
-          break
-        else:
-          return None
+        # Ask before taking a rate limit slot, the user may take a while
+        if input(f"\n{pargs[0]}\nAre you sure you wish to delete (Yes/No)? ").lower() not in ('y', 'yes'):
+            return None
+
+        return self._delete(*pargs, **kwargs)
+
+    @rate_limit(90, 'send')
+    def _delete(self, *pargs, **kwargs) -> requests.Response:
+        """API: Unconfirmed `delete`, see `delete()`"""
+        return self.__send('DELETE', *pargs, **kwargs)
 
     def _url(self, path: str) -> str:
         """Construct the full URL for an API call
@@ -379,9 +702,36 @@ class Api(object):
         """
         return f'{self.api_url}{path}'
 
+    def _path(self, kind: str, name: Optional[str] =None, ver: int =1) -> str:
+        """Construct an API path
+
+        Args:
+           kind (str): Root path, one of 'customer', 'domain', 'accounts' or 'aliases'
+           name (str, optional): Account or alias name to append to the root path
+           ver (int, optional): API Version, defaults to 1
+
+        Returns:
+           str: API path
+
+        Raises:
+           KeyError: Unknown `kind`
+        """
+        if ver == 1:
+            root = self._paths_v1[kind]
+        else:
+            root = self._PATHS[kind].format(ver=ver, customer=self.customer, domain=self.domain)
+
+        if name is None:
+            return root
+
+        return f'{root}/{name}'
+
     def _customer_path(self, ver: int =1) -> str:
         """Construct the path for customer root path
 
+        NOTES:
+           See `_path()`
+
         Args:
            ver (int, optional): API Version, defaults to 1
 
@@ -391,15 +741,16 @@ class Api(object):
         Raises:
            None
         """
-        return f'/v{ver}/customers/{self.customer}'
+        return self._path('customer', ver=ver)
 
-    def _domain_path(self, *pargs, **kwargs) -> str:
+    def _domain_path(self, ver: int =1) -> str:
         """Construct the path for the domain root path
 
         NOTES:
-           See `_customer_path()`
+           See `_path()`
 
         Args:
+           ver (int, optional): API Version, defaults to 1
 
         Returns:
            str: Domain API path
@@ -407,16 +758,16 @@ class Api(object):
         Raises:
            None
         """
-        root = self._customer_path(*pargs, **kwargs)
-        return f'{root}/domains/{self.domain}'
+        return self._path('domain', ver=ver)
 
-    def _accounts_path(self, *pargs, **kwargs) -> str:
+    def _accounts_path(self, ver: int =1) -> str:
         """Construct the path for the accounts root path
 
         NOTES:
-           See `_domain_path()`
+           See `_path()`
 
         Args:
+           ver (int, optional): API Version, defaults to 1
 
         Returns:
            str: Accounts API path
@@ -424,17 +775,17 @@ class Api(object):
         Raises:
            None
         """
-        root = self._domain_path(*pargs, **kwargs)
-        return f'{root}/rs/mailboxes'
+        return self._path('accounts', ver=ver)
 
-    def _account_path(self, account: str, *pargs, **kwargs) -> str:
+    def _account_path(self, account: str, ver: int =1) -> str:
         """Construct the path for an account root path
 
         NOTES:
-           See `_accounts_path()`
+           See `_path()`
 
         Args:
            account (str): Account name for the request
+           ver (int, optional): API Version, defaults to 1
 
         Returns:
            str: Account API path
@@ -442,16 +793,16 @@ class Api(object):
         Raises:
            None
         """
-        root = self._accounts_path(*pargs, **kwargs)
-        return f'{root}/{account}'
+        return self._path('accounts', account, ver=ver)
 
-    def _aliases_path(self, *pargs, **kwargs) -> str:
+    def _aliases_path(self, ver: int =1) -> str:
         """Construct the path for aliases root path
 
         NOTE:
-           See `_domain_path()`
+           See `_path()`
 
         Args:
+           ver (int, optional): API Version, defaults to 1
 
         Returns:
            str: Aliases API path
@@ -459,17 +810,17 @@ class Api(object):
         Raises:
            None
         """
-        root = self._domain_path(*pargs, **kwargs)
-        return f'{root}/rs/aliases'
+        return self._path('aliases', ver=ver)
 
-    def _alias_path(self, alias: str, *pargs, **kwargs) -> str:
+    def _alias_path(self, alias: str, ver: int =1) -> str:
         """Construct the path for an alias root path
 
         NOTE:
-           See `_aliases_path()`
+           See `_path()`
 
         Args:
            alias (str): Name of alias for call
+           ver (int, optional): API Version, defaults to 1
 
         Returns:
            str: Alias API path
@@ -477,8 +828,24 @@ class Api(object):
         Raises:
            None
         """
-        root = self._aliases_path(*pargs, **kwargs)
-        return f'{root}/{alias}'
+        return self._path('aliases', alias, ver=ver)
+
+    @classmethod
+    def set_verbose(cls, verbose: bool =True) -> None:
+        """Log the request trace and error bodies at INFO level
+
+        Applies to all Api objects.  Output goes to the 'rackspace.api' logger
+
+        Args:
+           verbose (bool, optional): True to enable, False to disable, defaults True
+
+        Returns:
+           None
+
+        Raises:
+           None
+        """
+        cls.verbose = verbose
 
     @staticmethod
     def httpclient_logging_unpatch(level: int =logging.DEBUG) -> None:
@@ -545,7 +912,13 @@ class Api(object):
         try:
             if response.status_code != status_code:
                 if response.text and output:
-                    print(json.dumps(response.json(), sort_keys=True, indent=4))
+                    # Pretty printing costs a parse and dump of the body,
+                    # only do it when someone is listening
+                    level = logging.INFO if Api.verbose else logging.DEBUG
+                    if Api._log.isEnabledFor(level):
+                        Api._log.log(level, _json_pretty(_json_loads(response.content)))
+                    else:
+                        sys.stderr.write(f'{response.text}\n')
                 return False
             return True
         except AttributeError:
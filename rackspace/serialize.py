@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+from typing import Any
+
+# orjson is optional, faster and works on bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#
+# NOTE: split.py and sync.py both store objects as .json files, and
+# sync-inc.py compares their checksums.  Both must write byte identical
+# output for the same data, so they share dump_json() from here.
+
+
+def dump_json(data: Any) -> bytes:
+    """Canonical (sorted, compact) JSON bytes, with orjson when available
+
+    Args:
+       data (Any): JSON serializable data
+
+    Returns:
+       bytes: UTF-8 encoded JSON, keys sorted, no whitespace
+
+    Raises:
+       TypeError: If `data` is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+    # Like OPT_NON_STR_KEYS, turn int/bool/None keys into strings before
+    # sorting, sort_keys would otherwise order (or fail on) the raw keys
+    data = json.loads(json.dumps(data))
+
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available
+
+    Args:
+       raw (bytes): UTF-8 encoded JSON
+
+    Returns:
+       Any: Decoded data
+
+    Raises:
+       ValueError: If `raw` is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+
+    return json.loads(raw)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import copy
-import json
+import contextvars
 
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, List
 
-from .api import Api
+from .api import Api, MAX_WORKERS
 
 # NOTE: Spam settings are stored in 5 separate endpoints each, for
 # both domains AND accounts.  These consist of the 'settings',
@@ -20,6 +19,19 @@ from .api import Api
 
 DEBUG = False
 VALID_ACL = ('blocklist', 'ipblocklist', 'safelist', 'ipsafelist')
+VALID_ACL_SET = frozenset(VALID_ACL)
+
+# Settings where yaml turns 'on'/'off' into True/False
+ONOFF_KEYS = frozenset(('filterLevel', 'forwardToDomainQuarantine'))
+BOOL_ONOFF = {True: 'on', False: 'off'}
+
+# Settings that must not be sent with a given 'rsEmail.spamHandling' value
+#   toFolder is mutually exclusive to 'spamForwardingAddress'
+#   toAddress is mutually exclusive to 'hasFolderCleaner', 'spamFolderAgeLimit' and 'spamFolderNumLimit'
+SPAM_HANDLING_EXCLUDES = {
+        'toFolder': frozenset(('rsEmail.spamForwardingAddress',)),
+        'toAddress': frozenset(('rsEmail.hasFolderCleaner', 'rsEmail.spamFolderAgeLimit', 'rsEmail.spamFolderNumLimit')),
+        }
 
 def _positive(x: int) -> None:
     """Ensure the passed in value is a positive integer
@@ -36,64 +48,37 @@ def _positive(x: int) -> None:
     if x < 0:
         raise ValueError(f'Value {x!r} is a negative number!')
 
-@dataclass
 class Field(object):
-    """Field value class
+    """Field specification class
 
     Field() class helps constrain a value to a specific type,
-    handles default value, value constraints and testing
+    handles default value, value constraints and testing.
+
+    Field objects are shared templates, the values themselves
+    are stored by the owning object (see `Settings.data`)
     """
-    type: Any = None
-    default: Any = None
-    valid: Any = None
-    test: Any = None
-    value: Any = None
+    __slots__ = ('type', 'default', 'valid', 'test', '_valid')
+
+    def __init__(self, type: Any =None, default: Any =None, valid: Any =None, test: Any =None) -> None:
+        self.type = type
+        self.default = default
+        self.valid = valid
+        self.test = test
+
+        # hashed copy of `valid` for the membership test
+        self._valid = frozenset(valid) if isinstance(valid, tuple) else None
 
     def __repr__(self):
         test = self.test
         if test is not None:
             test = f'{test.__name__}()'
-        return f'{self.__class__.__name__}(type={self.type.__name__!r}, value={self.value!r}, default={self.default!r}, valid={self.valid!r}, test={test})'
-
-    def __eq__(self, other):
-        if self.__class__ != other.__class__:
-            return False
-
-        elif self.type != other.type:
-            return False
-
-        return self.get() == other.get()
-
-    def default(self) -> Any:
-        """Returns the default value of Field
-
-        Args:
-            None
+        return f'{self.__class__.__name__}(type={self.type.__name__!r}, default={self.default!r}, valid={self.valid!r}, test={test})'
 
-        Returns:
-            Any: None or defined default value
-        """
-        return self.default
-
-    def get(self) -> Any:
-        """Returns the stored value, or default if no value stored
+    def validate(self, value) -> None:
+        """Validates a value against the field constraints
 
         Args:
-            None
-
-        Returns:
-            Any: Stored value, or default value
-        """
-        if self.value is None:
-            return self.default
-
-        return self.value
-
-    def set(self, value) -> None:
-        """Stores a value
-
-        Args:
-            value: Value to store
+            value: Value to validate
 
         Returns:
             None
@@ -103,23 +88,19 @@ class Field(object):
             ValueError: `value` is not one of the specified `valid` values
             ValueError: `value` failed the test function
         """
-        if value is None:
-            self.value = None
-            return
-
         if not isinstance(value, self.type):
             raise TypeError(f'value {value!r} MUST be of type {self.type.__name__!r}')
 
-        if isinstance(self.valid, tuple) and value not in self.valid:
+        if self._valid is not None and value not in self._valid:
             raise ValueError(f'value {value!r} MUST be one of {self.valid!r}')
 
         if self.test is not None:
             self.test(value)
 
-        self.value = value
-
 class Spam(object):
     """Spam container object, holds the Settings and ACL objects"""
+    __slots__ = ('data', 'acl', 'pargs', 'kwargs')
+
     def __repr__(self):
         return f'{self.__class__.__name__}(settings={self.data}, acl={self.acl})'
 
@@ -127,35 +108,30 @@ class Spam(object):
         if self.data != other.data:
             return False
 
-        for acl in set(self.acl) | set(other.acl):
-            if acl not in self.acl or acl not in other.acl:
-                return False
-            if self.acl[acl] != other.acl[acl]:
-                return False
-        return True
+        # Both ACL dicts are always keyed by VALID_ACL
+        return all(self.acl[acl] == other.acl[acl] for acl in VALID_ACL)
 
     def __init__(self, *pargs, **kwargs) -> None:
         self.data = None
-        self.acl = {x: None for x in VALID_ACL}
 
         # Pull data out of kwargs, Settings and ACL need subsets
         # not the full set
-        data = kwargs.pop('data', {})
+        # data=None is the same as no data
+        data = kwargs.pop('data', None) or {}
 
         # Save pargs and kwargs for future calls to Settings and ACL classes
+        # kwargs is already a fresh dict built for this call, no copy needed
         self.pargs = pargs
-        self.kwargs = dict(kwargs)
+        self.kwargs = kwargs
 
         # Grab settings object, if config contains settings data
         if 'settings' in data:
             self.data = Settings(data=data['settings'], *pargs, **kwargs)
 
         # Grab acl object(s), if config contains acl settings data
-        for acl in VALID_ACL:
-            if acl in data:
-                self.acl[acl] = ACL(acl=acl, data=data[acl], *pargs, **kwargs)
-            else:
-                self.acl[acl] = None
+        # every VALID_ACL key is always present, None if not configured
+        self.acl = {acl: ACL(acl=acl, data=data[acl], *pargs, **kwargs) if acl in data else None
+                    for acl in VALID_ACL}
 
     def get(self) -> Spam:
         """API: Get all spam settings from rackspace API
@@ -174,17 +150,54 @@ class Spam(object):
 
         new = Spam(*pargs, **kwargs)
 
-        # Get spam settings from API
+        # Settings and each ACL are separate API endpoints,
+        # fetch them concurrently instead of one after another
+        jobs = {acl: obj for acl, obj in self.acl.items() if obj is not None}
         if self.data is not None:
-            new.data = self.data.get()
+            jobs['settings'] = self.data
+
+        if not jobs:
+            return new
 
-        # Get ACL settings from API
-        for acl in self.acl:
-            if self.acl[acl] is not None:
-                new.acl[acl] = self.acl[acl].get()
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            # Run each job in a copy of our context, so context bound state
+            # (e.g. a caller's output buffer) follows into the pool
+            futures = {k: pool.submit(contextvars.copy_context().run, obj.get) for k, obj in jobs.items()}
+
+        for k, future in futures.items():
+            if k == 'settings':
+                new.data = future.result()
+            else:
+                new.acl[k] = future.result()
 
         return new
 
+    @classmethod
+    def get_many(cls, specs: List[dict], max_workers: int =MAX_WORKERS) -> List[Spam]:
+        """API: Get spam settings for many domains/accounts concurrently
+
+        Each spec is the keyword arguments for a `Spam()` object.  The
+        domain lives on the Api object, so specs for different domains
+        need their own Api objects.  Request rates are still capped by
+        the Api rate limiter, shared by every thread.
+
+        Args:
+            specs (list): List of `Spam()` keyword argument dicts
+            max_workers (int): Maximum number of `Spam.get()` calls to run at once
+
+        Returns:
+            list: New Spam() objects with rackspace settings, in `specs` order
+
+        Raises:
+            None
+        """
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as pool:
+            return list(pool.map(lambda ctx, spec: ctx.run(lambda: cls(**spec).get()),
+                                 [contextvars.copy_context() for _ in specs], specs))
+
     def diff(self, other: Spam) -> list:
         """Return difference information between two Spam objects
 
@@ -208,20 +221,18 @@ class Spam(object):
         elif self.data != other.data:
             diff.append('settings')
 
-        # Check each acl for changes
-        for acl in set(self.acl) | set(other.acl):
-            # Not sure this one actually works, it should not
-            # be a condition now that we predefine ACL types
-            if acl not in other.acl:
-                diff.append((acl, {'addList': None},))
+        # Check each acl for changes, both acl dicts are always keyed by VALID_ACL
+        for acl in VALID_ACL:
+            src, dst = self.acl[acl], other.acl[acl]
 
-            elif acl not in self.acl:
-                diff.append((acl, {'removeLisst': other.acl[acl].data}))
+            # Nothing to compare if either side doesn't have this acl
+            if src is None or dst is None:
+                continue
 
             # If the config acl does not match the rackspace acl
-            elif self.acl[acl] != other.acl[acl]:
+            if src != dst:
                 # Add the acl key, and the actual change state
-                diff.append((acl, self.acl[acl].diff(other.acl[acl])))
+                diff.append((acl, src.diff(dst)))
 
         return diff
 
@@ -256,6 +267,9 @@ class Spam(object):
 
 class Settings(object):
     """Object to hold state of spam settings"""
+    __slots__ = ('api', 'name', 'exchange', 'debug', 'override', 'fields', 'data', '_sections', '_path',
+                 '_is_domain', '_is_exchange')
+
     __DOMAIN_FIELDS = {
             'filterLevel': Field(str, 'on', ('on', 'off', 'exclusive')),
             'overrideUserSettings': Field(bool, False),
@@ -287,9 +301,30 @@ class Settings(object):
             'removeQuarantineOwner': Field(bool, False),
             }
 
+    # Settings sections and the prefix their keys get in our field names
+    #            ------------- from API --------------  ---- from config ----
+    __PREFIXED_SECTIONS = (('rsEmailSettings', 'rsEmail.'), ('exchangeSettings', 'exchange.'),
+                           ('rsEmail', 'rsEmail.'), ('exchange', 'exchange.'))
+
+    # exchange accounts don't have a prefix
+    __UNPREFIXED_SECTIONS = tuple((sub, '') for sub, _ in __PREFIXED_SECTIONS)
+
+    # Default values per context, copied into each new object
+    __DOMAIN_DEFAULTS = {k: v.default for k, v in __DOMAIN_FIELDS.items()}
+    __ACCOUNT_RS_DEFAULTS = {k: v.default for k, v in __ACCOUNT_RS_FIELDS.items()}
+    __ACCOUNT_EX_DEFAULTS = {k: v.default for k, v in __ACCOUNT_EX_FIELDS.items()}
+
+    # (is_domain, is_exchange) -> (field specs, default values, sections to load)
+    # a domain is never an exchange context, it has both settings
+    _CONTEXT_TABLES = {
+            (True, False): (__DOMAIN_FIELDS, __DOMAIN_DEFAULTS, __PREFIXED_SECTIONS),
+            (True, True): (__DOMAIN_FIELDS, __DOMAIN_DEFAULTS, __PREFIXED_SECTIONS),
+            (False, True): (__ACCOUNT_EX_FIELDS, __ACCOUNT_EX_DEFAULTS, __UNPREFIXED_SECTIONS),
+            (False, False): (__ACCOUNT_RS_FIELDS, __ACCOUNT_RS_DEFAULTS, __PREFIXED_SECTIONS),
+            }
+
     def __repr__(self):
-        data = {k: v.get() for k,v in self.data.items()}
-        data = json.dumps(data, sort_keys=True)
+        data = repr(dict(sorted(self.data.items())))
         return f'{self.__class__.__name__}(name={self.name!r}, exchange={self.exchange}, override={self.override}, data={data})'
 
     def __init__(self,
@@ -320,22 +355,32 @@ class Settings(object):
         self.exchange = exchange
         self.debug = debug
         self.override = override
+        self._path = None
+
+        # Context never changes for the life of the object
+        self._is_domain = name is None
+        self._is_exchange = bool(exchange)
 
         self._validate_override()
 
         if api is not None:
             self.api = api
 
-        self.data = self._get_fields()
+        # Field specs are shared, only the values are per object
+        self.fields, defaults, self._sections = self._get_context()
+        self.data = dict(defaults)
 
         if data is not None:
             self.load(data)
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if len(self.data) != len(other.data):
             return False
 
-        if self.__is_exchange() != other.__is_exchange():
+        if self._is_exchange != other._is_exchange:
             return False
 
         return self.data == other.data
@@ -357,7 +402,7 @@ class Settings(object):
             override = self.override
 
         # override is not valid in account context
-        if override and self.__is_account():
+        if override and not self._is_domain:
             raise Exception('Cannot set override on user settings')
 
         return True
@@ -378,31 +423,12 @@ class Settings(object):
         Raises:
             None
         """
-        # Search and fix on/off values
-        if k in ('filterLevel', 'forwardToDomainQuarantine'):
-            if v is True:
-                v = 'on'
-
-            elif v is False:
-                v = 'off'
-
-            # Short circuit any other checks
-            return v
+        # Search and fix on/off values, only True/False map (not 1/0)
+        if k in ONOFF_KEYS and isinstance(v, bool):
+            return BOOL_ONOFF[v]
 
         return v
 
-    def __is_domain(self) -> bool:
-        """Test if the context is domain settings"""
-        return self.name is None
-
-    def __is_account(self) -> bool:
-        """Test if the context is account settings"""
-        return not self.__is_domain()
-
-    def __is_exchange(self) -> bool:
-        """Test if the context is an exchange account"""
-        return self.exchange
-
     def diff(self, other: Settings) -> List[tuple]:
         """Generate differences compared to another Settings object
 
@@ -415,12 +441,44 @@ class Settings(object):
         Raises:
             None
         """
-        diff = []
-        for k in set(self.data) | set(other.data):
-            if self.data[k] != other.data[k]:
-                diff.append((k, self.data[k].get(), other.data[k].get()))
+        ours, theirs = self.data, other.data
+
+        # Settings only one side has (different contexts) always differ
+        diff = [(k, ours[k], None) for k in ours.keys() - theirs.keys()]
+        diff.extend((k, None, theirs[k]) for k in theirs.keys() - ours.keys())
+
+        diff.extend((k, ours[k], theirs[k]) for k in ours.keys() & theirs.keys() if ours[k] != theirs[k])
         return diff
 
+    def _set_field(self, k: str, v: Any) -> None:
+        """Validate and store a setting value
+
+        Args:
+            k (str): Name of setting
+            v (Any): Value to store, None resets to the default
+
+        Returns:
+            None
+
+        Raises:
+            KeyError: `k` is not a setting in this context
+            TypeError: `v` is not of required type
+            ValueError: `v` failed the setting constraints
+        """
+        field = self.fields[k]
+
+        if v is None:
+            self.data[k] = field.default
+            return
+
+        # Unchanged values (config matching the API) were already validated
+        current = self.data[k]
+        if type(v) is type(current) and v == current:
+            return
+
+        field.validate(v)
+        self.data[k] = v
+
     def load(self, data: dict, src: str ='cfg') -> None:
         """Load settings from dict into our object
 
@@ -434,51 +492,33 @@ class Settings(object):
         Raises:
             None
         """
-        settings = self.data
+        set_field, fix_value = self._set_field, self.__fix_value
 
         # yaml 'on' becomes True and 'off' becomes False.  These
         # need to stay 'on' and 'off'
         k = 'filterLevel'
         if k in data:
-            # save the fixed value in the Field of the setting
-            settings[k].set(self.__fix_value(k, data[k]))
+            # save the fixed value of the setting
+            set_field(k, fix_value(k, data[k]))
 
-        #           ------------- from API --------------  ---- from config ----
-        for sub in ('rsEmailSettings', 'exchangeSettings', 'rsEmail', 'exchange'):
-            if sub not in data:
+        ### Don't you love consistent, simplified interfaces.  Wish rackspace had one
+        for sub, prefix in self._sections:
+            section = data.get(sub)
+            if not section:
                 continue
 
-            # exchange accounts don't have a prefix
-            if self.__is_account() and self.__is_exchange():
-                prefix = ''
-
-            # domain exchange settings are prefixed with 'exchange.'
-            elif sub.startswith('exchange'):
-                prefix = 'exchange.'
-
-            # domain rsEmail and non-exchange account settings prefixed with 'rsEmail.'
-            else:
-                prefix = 'rsEmail.'
-
-            ### Don't you love consistent, simplified interfaces.  Wish rackspace had one
+            for k,v in section.items():
+                # save the fixed value of the setting
+                set_field(prefix + k if prefix else k, fix_value(k, v))
 
-            for k,v in data[sub].items():
-                # save the fixed value in the Field of the setting
-                settings[f'{prefix}{k}'].set(self.__fix_value(k, v))
-
-    def _get_account_path(self) -> str:
-        """Get the account path, if we're in an account context
-
-        Args:
-            None
+    @property
+    def _account_path(self) -> str:
+        """Account path segment, if we're in an account context
 
         Returns:
             str: Empty string for domain context, else the path segment for accounts
-
-        Raises:
-            None
         """
-        if self.__is_domain():
+        if self._is_domain:
             return ''
 
         # what account path type to use, 'ex' for exchange, 'rs' for rackspace
@@ -486,6 +526,17 @@ class Settings(object):
 
         return f'/{qtype}/mailboxes/{self.name}'
 
+    @property
+    def _settings_path(self) -> str:
+        """Full API path of the spam settings for this context
+
+        Returns:
+            str: API path, built once per object
+        """
+        if self._path is None:
+            self._path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{self._account_path}/spam/settings'
+        return self._path
+
     def get(self, *pargs, **kwargs) -> Settings:
         """API: Get spam settings object from the API
 
@@ -498,8 +549,7 @@ class Settings(object):
         Raises:
             None
         """
-        account = self._get_account_path()
-        path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{account}/spam/settings'
+        path = self._settings_path
 
         response = self.api.get(path, *pargs, **kwargs)
 
@@ -509,42 +559,26 @@ class Settings(object):
         # Probably a better way to do this
         return Settings(api=self.api, name=self.name, data=response.json(), exchange=self.exchange, debug=self.debug)
 
-    def _get_fields(self) -> dict:
-        """Get our list of setting fields for this context
+    def _get_context(self) -> tuple:
+        """Get our setting fields, defaults and load sections for this context
 
         Args:
             None
 
         Returns:
-            dict
+            tuple: ({name: Field()} shared field specs, do not modify,
+                    {name: default} shared default values, copy before use,
+                    ((section, prefix), ...) sections used by `.load()`)
 
         Raises:
             None
         """
-        cls = self.__class__
-
-        # Check for domain context
-        if self.__is_domain():
-            fields = cls.__DOMAIN_FIELDS
-
-        # check for exchange account context
-        elif self.__is_exchange():
-            fields = cls.__ACCOUNT_EX_FIELDS
+        # No copy needed, Field objects only describe the settings,
+        # the values are stored in self.data
+        return self.__class__._CONTEXT_TABLES[(self._is_domain, self._is_exchange)]
 
-        # we should be non-exchange account context
-        else:
-            fields = cls.__ACCOUNT_RS_FIELDS
-
-        # Deep Copy to prevent accidential mutable defaults
-        # from popping up.  I.E.
-        # a = Settings()  from config
-        # b = a.get()  get rackspace settings.  This could override
-        #              the settings in 'a', because they started from
-        #              the same dictionary of objects
-        return copy.deepcopy(fields)
-
-    def set(self, *pwargs, **kwargs):
-        return self.set(*pwargs, **kwargs)
+    def set(self, *pargs, **kwargs):
+        raise NotImplementedError('Settings.set() is not implemented')
 
     def update(self, override: bool =None, *pargs, **kwargs) -> bool:
         """API: Update any settings changes to the API
@@ -558,8 +592,7 @@ class Settings(object):
         Raises:
             None
         """
-        account = self._get_account_path()
-        path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{account}/spam/settings'
+        path = self._settings_path
 
         if override is None:
             override = self.override
@@ -568,23 +601,12 @@ class Settings(object):
 
         # must send all values, or things my change in unexpected ways
         # DO NOT try and give only changed settings
-        data = dict(self.data)
-
-        # toFolder is mutually exclusive to 'SpamForwardingAddress'
-        if data.get('rsEmail.spamHandling', Field(str, '')).get() == 'toFolder':
-            data.pop('rsEmail.spamForwardingAddress')
-
-        # toAddress is mutually exclusive to 'hasFolderCleaner', 'spamFolderAgeLimit' and 'spamFolderNumLimit'
-        elif data.get('rsEmail.spamHandling', Field(str, '')).get() == 'toAddress':
-            for x in ('hasFolderCleaner', 'spamFolderAgeLimit', 'spamFolderNumLimit'):
-                data.pop(f'rsEmail.{x}')
+        skip = SPAM_HANDLING_EXCLUDES.get(self.data.get('rsEmail.spamHandling'), frozenset())
+        data = {k: v for k, v in self.data.items() if k not in skip}
 
         # Make sure to set the override setting, if set
         if override:
-            data.update({'overrideUserSettings': Field(bool, True)})
-
-        # Convert {k: Field()} to normal {k: v} dict for API call
-        data = {k: v.get() for k,v in data.items()}
+            data['overrideUserSettings'] = True
 
         if self.debug:
             print(f"\n{path}\n   SPAM SETTINGS SET: '{data}'")
@@ -595,12 +617,20 @@ class Settings(object):
 
 class ACL(object):
     """ACL object for spam settings"""
+    __slots__ = ('api', 'name', 'data', '_dataset', 'debug', 'exchange', 'acl', '_path')
+
     def __repr__(self):
-        data = json.dumps(sorted(self.data), sort_keys=True)
+        data = repr(sorted(self.data))
         return f'{self.__class__.__name__}(acl={self.acl!r}, name={self.name!r}, exchange={self.exchange}, data={data})'
 
     def __eq__(self, other):
-        return set(self.data) == set(other.data)
+        if not isinstance(other, ACL):
+            return NotImplemented
+
+        return self._dataset == other._dataset
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._dataset
 
     def __init__(self,
                  acl: str,
@@ -627,11 +657,13 @@ class ACL(object):
         """
         self.api = api
         self.name = name
+        self._path = None
         self.data = []
+        self._dataset = frozenset()
         self.debug = debug
         self.exchange = exchange
 
-        if acl not in VALID_ACL:
+        if acl not in VALID_ACL_SET:
             raise ValueError(f"acl '{acl}' must be one of {VALID_ACL}")
 
         self.acl = acl
@@ -660,19 +692,16 @@ class ACL(object):
         if not isinstance(data, list):
             raise TypeError('ACL must be a list format of addresses or IPs')
 
-        self.data = list(set(data))
+        # Keep a frozenset around for comparisons and diffs
+        self._dataset = frozenset(data)
+        self.data = list(self._dataset)
 
-    def _get_account_path(self):
-        """Get the account path, if we're in an account context
-
-        Args:
-            None
+    @property
+    def _account_path(self) -> str:
+        """Account path segment, if we're in an account context
 
         Returns:
             str: Empty string for domain context, else the path segment for accounts
-
-        Raises:
-            None
         """
         if self.name is None:
             return ''
@@ -682,6 +711,17 @@ class ACL(object):
 
         return f'/{qtype}/mailboxes/{self.name}'
 
+    @property
+    def _acl_path(self) -> str:
+        """Full API path of this spam ACL
+
+        Returns:
+            str: API path, built once per object
+        """
+        if self._path is None:
+            self._path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{self._account_path}/spam/{self.acl}'
+        return self._path
+
     def get(self, *pargs, **kwargs) -> ACL:
         """API: Get spam ACL object from the API
 
@@ -694,8 +734,7 @@ class ACL(object):
         Raises:
             None
         """
-        account = self._get_account_path()
-        path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{account}/spam/{self.acl}'
+        path = self._acl_path
 
         response = self.api.get(path, *pargs, **kwargs)
 
@@ -721,24 +760,11 @@ class ACL(object):
         if self == other:
             return None
 
-        # Build basic structure, using sets to dedupe addresses/IPs
-        diff = {'addList': set(), 'removeList': set()}
-
-        # bi-directional compare
-        for k, src, dst in (('addList', self, other), ('removeList', other, self)):
-            for x in src.data:
-                if x not in dst.data:
-                    diff[k].add(x)
-
-        # Use a list, as we are likely to remove keys in-flight
-        for k in list(diff):
-            v = diff[k]
-
-            if not v:
-                diff.pop(k)
-
-            else:
-                diff[k] = ','.join(v)
+        # bi-directional compare, only keep non-empty changes
+        # sorted so the API payload (and debug output) is stable
+        changes = (('addList', self._dataset - other._dataset),
+                   ('removeList', other._dataset - self._dataset))
+        diff = {k: ','.join(sorted(v)) for k, v in changes if v}
 
         # return our modified diff
         return diff
@@ -761,8 +787,7 @@ class ACL(object):
         if not data:
             return True
 
-        account = self._get_account_path()
-        path = f'/v1/customers/{self.api.customer}/domains/{self.api.domain}{account}/spam/{self.acl}'
+        path = self._acl_path
 
         if self.debug:
             print(f"\n{path}\n   SPAM SETTINGS ACL '{self.acl}': '{data}'")
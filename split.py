@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
-import copy
-import glob
-import json
 import os
+import tempfile
 import yaml
 
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from rackspace.serialize import dump_json
+
 CONFIG_DIR = 'conf.d'
 SYNC_DIR = 'tmp'
+ACLS = ('blocklist', 'ipblocklist', 'safelist', 'ipsafelist')
+
+# .json files stored by the current parse_config() call
+STORED = set()
 
 def store(src, address, data, data_dir):
 
@@ -17,48 +28,61 @@ def store(src, address, data, data_dir):
 
     fname = f'{address}-{src}'
 
-    target = os.path.join(data_dir, fname)
+    target = f'{os.path.join(data_dir, fname)}.json'
+    STORED.add(target)
+
+    payload = dump_json(data)
+
+    # Leave unchanged files alone, nothing for sync-inc.py to look at
+    try:
+        with open(target, 'rb') as fh:
+            if fh.read() == payload:
+                return
+    except FileNotFoundError:
+        pass
 
-    json_data = json.dumps(data, sort_keys=True)
-    with open(f'{target}.json', 'w') as fh:
-        fh.write(json_data)
+    # Write to a temp file and rename, never leave a partial .json behind.
+    # The name is unique, workers may store the same target concurrently
+    fd, tmpfile = tempfile.mkstemp(dir=data_dir, prefix=f'.{fname}.')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(payload)
 
-def parse_spam(domain, tmp_config, args, account=None):
-    config = copy.deepcopy(tmp_config)
+        os.replace(tmpfile, target)
+
+    except BaseException:
+        os.unlink(tmpfile)
+        raise
+
+def parse_spam(domain, config, args, account=None):
     if account is None:
         account=''
 
-    for acl in ('blocklist', 'ipblocklist', 'safelist', 'ipsafelist'):
+    # sorted() builds new lists, config is only read, no copy needed
+    address = f'{account}@{domain}'
+    for acl in ACLS:
         if acl in config and len(config[acl]) > 0:
-            store(acl, f'{account}@{domain}', sorted(list(set(config[acl]))), data_dir=args.data)
-            config.pop(acl)
+            store(acl, address, sorted(set(config[acl])), data_dir=args.data)
 
     if 'settings' in config:
-        store('spam', f'{account}@{domain}', config['settings'], data_dir=args.data)
+        store('spam', address, config['settings'], data_dir=args.data)
 
 def parse_aliases(config, args):
     for alias in config:
         store('alias', alias, config[alias], data_dir=args.data)
 
-def parse_account(domain, tmp_config, account, aliases, args):
-    config = copy.deepcopy(tmp_config)
+def parse_account(domain, config, account, aliases, args):
     email = f'{account}@{domain}'
 
     if 'spam' in config:
         parse_spam(domain, config['spam'], args, account)
-        config.pop('spam')
 
     if 'aliases' in config:
         for alias in config['aliases']:
-            if alias not in aliases:
-                aliases[alias] = [email]
-
-            else:
-                aliases[alias].append(email)
+            aliases.setdefault(alias, []).append(email)
 
-        config.pop('aliases')
-
-    store('account', email, config, data_dir=args.data)
+    # Everything else is account data, leave the loaded config untouched
+    store('account', email, {k: v for k, v in config.items() if k not in ('spam', 'aliases')}, data_dir=args.data)
 
 def parse_accounts(domain, config, args):
     aliases = {}
@@ -68,9 +92,12 @@ def parse_accounts(domain, config, args):
     parse_aliases(aliases, args)
 
 def parse_config(fname, domain, args):
-    with open(fname, 'r') as fh:
-        raw = fh.read()
-    data = yaml.safe_load(raw)
+    # Worker processes are reused, only report this file's objects
+    STORED.clear()
+
+    # libyaml reads the raw bytes itself, skip Python's text decoding
+    with open(fname, 'rb') as fh:
+        data = yaml.load(fh, Loader=SafeLoader)
     for k,v in data.items():
         if k == 'spam':
             parse_spam(domain, v, args)
@@ -78,17 +105,38 @@ def parse_config(fname, domain, args):
         elif k == 'accounts':
             parse_accounts(domain, v, args)
 
+    return set(STORED)
+
+def iter_files(path, ext):
+    """Yield the paths of the non-hidden files in `path` ending with `ext`"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.endswith(ext) and not entry.name.startswith('.') and entry.is_file():
+                yield entry.path
+
+def iter_configs(path):
+    """Yield (path, filename) of every domain .yml file under `path`, recursively"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Don't follow symlinked directories, a link loop would never end
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_configs(entry.path)
+
+            elif entry.name.endswith('.yml') and entry.is_file():
+                yield entry.path, entry.name
+
 def cleandir_md5(path):
-    for fname in glob.glob(f'''{os.path.join(path, '*.md5')}'''):
+    for fname in iter_files(path, '.md5'):
         jsonfile = f"{os.path.splitext(fname)[0]}.json"
         if os.path.exists(jsonfile):
             continue
 
         os.unlink(fname)
 
-def cleandir_json(path):
-    for fname in glob.glob(f'''{os.path.join(path, '*.json')}'''):
-        os.unlink(fname)
+def cleandir_json(path, keep):
+    for fname in iter_files(path, '.json'):
+        if fname not in keep:
+            os.unlink(fname)
 
 
 if __name__ == '__main__':
@@ -97,20 +145,24 @@ if __name__ == '__main__':
     parser.add_argument('--data', '-d', default=SYNC_DIR)
     args = parser.parse_args()
 
-    # Remove files before recreating them, keeps obsolete files from building up
-    # sync-inc.py will handle removing .md5 files without a corresponding .json file
-    # but we need to clear .json to signify a mail object (account/alias/etc) was deleted
-    cleandir_json(args.data)
-
     #conf.d
     #[]
     #['arch-mage.com.yml', 'domain.com.yml.dist', 'moonlightimagery.biz.yml', 'moonlightimagery.com.yml']
-    for path, dirs, files in os.walk(args.config):
-        for fname in files:
-            if not fname.endswith('.yml'):
-                continue
-            filepath = os.path.join(path, fname)
-            (domain, ext) = os.path.splitext(fname)
-
-            parse_config(filepath, domain, args)
+    tasks = []
+    for filepath, fname in iter_configs(args.config):
+        (domain, ext) = os.path.splitext(fname)
+
+        tasks.append((filepath, domain))
+
+    # Each domain file writes its own set of files, parse them in parallel
+    stored = set()
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(tasks))) as pool:
+            for files in pool.map(parse_config, *zip(*tasks), [args] * len(tasks)):
+                stored |= files
+
+    # Remove .json files no longer in the config, keeps obsolete files from building up
+    # sync-inc.py will handle removing .md5 files without a corresponding .json file
+    # but we need to clear .json to signify a mail object (account/alias/etc) was deleted
+    cleandir_json(args.data, stored)
 
@@ -2,15 +2,32 @@
 
 import argparse
 import hashlib
-import json
+import logging
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from rackspace import spam, Api, Account, Alias
+from rackspace.serialize import load_json
 
 KEYS = ['account', 'alias', 'spam', 'blocklist', 'ipblocklist', 'safelist', 'ipsafelist']
 REMOVE = ('account', 'alias')
 
+# sync file type -> object constructor, called with (api, name)
+OBJECTS = {
+    'account': lambda api, name: Account(api=api, name=name),
+    'alias': lambda api, name: Alias(api=api, name=name),
+    'spam': lambda api, name: spam.Settings(api=api, name=name),
+    'blocklist': lambda api, name: spam.ACL(api=api, acl='blocklist', name=name),
+    'ipblocklist': lambda api, name: spam.ACL(api=api, acl='ipblocklist', name=name),
+    'safelist': lambda api, name: spam.ACL(api=api, acl='safelist', name=name),
+    'ipsafelist': lambda api, name: spam.ACL(api=api, acl='ipsafelist', name=name),
+}
+
 SYNC_DIR = 'tmp'
 CONFIG_FILE = 'conf.yml'
 
@@ -30,20 +47,7 @@ def split(fname):
 
     api.domain = domain
 
-    if _type == 'account':
-        obj = Account(api=api, name=name)
-    elif _type == 'alias':
-        obj = Alias(api=api, name=name)
-    elif _type == 'spam':
-        obj = spam.Settings(api=api, name=name)
-    elif _type == 'blocklist':
-        obj = spam.ACL(api=api, acl='blocklist', name=name)
-    elif _type == 'ipblocklist':
-        obj = spam.ACL(api=api, acl='ipblocklist', name=name)
-    elif _type == 'safelist':
-        obj = spam.ACL(api=api, acl='safelist', name=name)
-    elif _type == 'ipsafelist':
-        obj = spam.ACL(api=api, acl='ipsafelist', name=name)
+    obj = OBJECTS[_type](api, name)
 
     return addr, obj
 
@@ -108,10 +112,8 @@ def remove(fname):
         os.unlink(f'{fname}.md5')
 
 def cfg(cfg_name):
-    with open(cfg_name) as fh:
-        raw = fh.read()
-
-    data = yaml.safe_load(raw)
+    with open(cfg_name, 'rb') as fh:
+        data = yaml.load(fh, Loader=SafeLoader)
 
     global api
     api = Api(user_key=data['user_key'], secret_key=data['secret_key'], customer_id=data['customer_id'])
@@ -122,8 +124,13 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--data', '-d', default=SYNC_DIR)
     parser.add_argument('--conf', '-c', default=CONFIG_FILE)
+    parser.add_argument('--verbose', '-v', default=False, action='store_true')
     args = parser.parse_args()
 
+    # --verbose brings back the request trace and error bodies, see Api.set_verbose()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
+    Api.set_verbose(args.verbose)
+
     cfg(args.conf)
 
     settings = {k: {} for k in KEYS}
@@ -142,33 +149,29 @@ if __name__ == '__main__':
             basename, ext = os.path.splitext(filepath)
             _type = basename.split('-')[-1]
 
-            with open(filepath, 'r') as fh:
+            # Read as bytes, hash and parse them without a decode/encode round trip
+            with open(filepath, 'rb') as fh:
                 data = fh.read()
 
             if ext == '.md5':
-                cksum[_type].update({basename: {'md5': data}})
+                cksum[_type].update({basename: {'md5': data.decode()}})
 
             elif ext == '.json':
-                md5 = hashlib.md5(data.encode()).hexdigest()
-                settings[_type].update({basename: {'json': json.loads(data), 'md5': md5}})
+                md5 = hashlib.md5(data).hexdigest()
+                settings[_type].update({basename: {'json': load_json(data), 'md5': md5}})
 
     for _type in KEYS:
         cfg = settings[_type]
         md5 = cksum[_type]
 
-        keys = list(cfg)
-        for fpath in keys:
-
-            if fpath not in md5 or cfg[fpath]['md5'] != md5[fpath]['md5']:
-                sync(fpath, cfg[fpath])
-
-            cfg.pop(fpath)
-            if fpath in md5:
-                md5.pop(fpath)
+        # New or changed since the last sync
+        for fpath, data in cfg.items():
+            if fpath not in md5 or data['md5'] != md5[fpath]['md5']:
+                sync(fpath, data)
 
         if _type not in REMOVE:
             continue
 
-        keys = list(md5)
-        for fpath in keys:
+        # Synced before, but no longer in the config
+        for fpath in md5.keys() - cfg.keys():
             remove(fpath)
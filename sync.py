@@ -1,22 +1,61 @@
 #!/usr/bin/env python3
 
 import argparse
-import copy
+import contextvars
 import hashlib
-import json
+import logging
 import os
+import sys
 import time
 import yaml
 
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from rackspace import Account, Accounts
 from rackspace import Alias, Aliases, Spam
 from rackspace import Api
+from rackspace.api import MAX_WORKERS
+from rackspace.serialize import dump_json
 
 CONFIG_FILE = 'conf.yml'
 CONFIG_DIR  = 'conf.d'
 SYNC_DIR    = 'tmp'
 DEBUG = False
+DOMAIN_WORKERS = 4
 ACCOUNT_FIELDS = ('firstName', 'lastName', 'displayName', 'enabled', 'password')
+SPAM_TYPES = ('blocklist', 'safelist', 'ipblocklist', 'ipsafelist', 'settings')
+
+# Parsed YAML files, {path: ((mtime_ns, size), data)}, data is shared, do not modify
+CONFIG_CACHE = {}
+
+# Output of the current run_all() item, [(stream, text), ...], None outside of one
+OUTPUT = contextvars.ContextVar('OUTPUT', default=None)
+
+class ThreadOutput(object):
+    """Stand in for sys.stdout/sys.stderr
+
+    Output written inside a `run_all()` item is held back, and written
+    out by the calling thread in item order, so lines of concurrent
+    items do not interleave.  Everything else is passed straight through
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = OUTPUT.get()
+        if buffer is None:
+            return self.stream.write(text)
+
+        buffer.append((self.stream, text))
+        return len(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
 
 def load_md5(fname):
     with open(fname, 'r') as fh:
@@ -24,6 +63,17 @@ def load_md5(fname):
 
     return md5
 
+def write_atomic(fname, data: bytes):
+    # Write to a temp file and rename, an interrupted run never leaves
+    # a partial .json/.md5 behind for the next run to trust
+    path, base = os.path.split(fname)
+    tmpfile = os.path.join(path, f'.{base}.tmp')
+
+    with open(tmpfile, 'wb') as fh:
+        fh.write(data)
+
+    os.replace(tmpfile, fname)
+
 def save_md5(target, md5, debug=False):
     # Don't overwrite if the data hasn't changed, preserves the timestamp
     # of the file, showing the last time it was updated
@@ -35,8 +85,7 @@ def save_md5(target, md5, debug=False):
     except FileNotFoundError:
         pass
 
-    with open(md5_file, 'w') as fh:
-        fh.write(md5)
+    write_atomic(md5_file, md5.encode())
 
 def store(src, address, data, data_dir, debug=False):
     if len(data) < 1:
@@ -44,22 +93,41 @@ def store(src, address, data, data_dir, debug=False):
 
     target = os.path.join(data_dir, f'{"." if debug else ""}{address}-{src}')
 
-    json_data = json.dumps(data, sort_keys=True)
+    json_data = dump_json(data)
+    md5 = hashlib.md5(json_data).hexdigest()
 
-    with open(f'{target}.json', 'w') as fh:
-        fh.write(json_data)
+    # Nothing to write if the stored checksum matches and the .json is there
+    try:
+        if load_md5(f'{target}.md5') == md5 and os.path.exists(f'{target}.json'):
+            return
+    except FileNotFoundError:
+        pass
 
-    md5 = hashlib.md5(json_data.encode()).hexdigest()
+    # .json first, if interrupted before the .md5 the checksums differ
+    # and the next run simply writes both again
+    write_atomic(f'{target}.json', json_data)
     save_md5(target, md5)
 
+def load_yaml(name):
+    # --watch reloads every file on each change, only parse the ones that changed
+    st = os.stat(name)
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = CONFIG_CACHE.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(name, 'rb') as fh:
+        data = yaml.load(fh, Loader=SafeLoader)
+
+    CONFIG_CACHE[name] = (key, data)
+    return data
+
 def load_config(name=None):
     if name is None:
         name = CONFIG_FILE
 
-    with open(name, 'r') as fh:
-        raw = fh.read()
-
-    data = yaml.safe_load(raw)
+    data = load_yaml(name)
 
     if 'domains' in data:
         domains = {}
@@ -69,45 +137,80 @@ def load_config(name=None):
             domain_data = load_config(domain_file)
             domains[domain] = domain_data
 
-        data['domains'] = domains
+        # New top level dict, the cached one keeps its list of domains
+        data = dict(data, domains=domains)
 
     return data
 
 def _init_accounts(domain, data, api):
     accounts = {}
     aliases = {}
+    suffix = f'@{domain}'
 
     for acct_name, _acct_data in data.items():
-        email = f'{acct_name}@{domain}'
-
-        account = Account(email, data=data[acct_name], api=api, debug=DEBUG)
-        accounts.update({acct_name.lower(): account})
+        email = acct_name + suffix
 
-        if 'aliases' not in _acct_data:
-            continue
+        accounts[acct_name.lower()] = Account(email, data=_acct_data, api=api, debug=DEBUG)
 
-        for _alias in _acct_data['aliases']:
-            alias = _alias.replace(f'@{domain}', '')
+        for _alias in _acct_data.get('aliases', ()):
+            alias = _alias[:-len(suffix)] if _alias.endswith(suffix) else _alias
             alias_lc = alias.lower()
-            if alias not in aliases:
+
+            alias_obj = aliases.get(alias_lc)
+            if alias_obj is None:
                 aliases[alias_lc] = Alias(name=alias, address=email, api=api, debug=DEBUG)
 
             else:
-                aliases[alias_lc].add_address(email)
+                alias_obj.add_address(email)
 
     return accounts, aliases
 
+def _run_item(func, item):
+    # Runs in a fresh context copy, the buffer is only seen by this item
+    # (and any pools it starts with a copy of its context)
+    OUTPUT.set([])
+    try:
+        return func(item), OUTPUT.get(), None
+    except Exception as e:
+        return None, OUTPUT.get(), e
+
+def run_all(func, items, max_workers=MAX_WORKERS):
+    # Rackspace has no bulk endpoint, overlap the per-object calls instead.
+    # The Api throttles how many writes are in flight at once.  Nothing run
+    # here may prompt, removals stay on the calling thread
+    items = list(items)
+    if not items:
+        return []
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        jobs = pool.map(lambda item: contextvars.copy_context().run(_run_item, func, item), items)
+
+        # Each item's output is written as a block, in item order
+        for result, output, error in jobs:
+            for stream, text in output:
+                stream.write(text)
+
+            # Worker exceptions are raised here
+            if error is not None:
+                raise error
+
+            results.append(result)
+
+    return results
+
 def store_account(account):
-    data = {}
-    for field in ACCOUNT_FIELDS:
-        if field in account.data:
-            data[field] = account.data[field]
+    # Few fields, many account keys, probe the fields rather than scan the data
+    data = account.data
+    data = {field: data[field] for field in ACCOUNT_FIELDS if field in data}
 
     store('account', account.name, data, SYNC_DIR, debug=DEBUG)
 
 def process_accounts(cfg_accounts, rs_accounts, domain):
     print('- Accounts(process)')
-    for name, account in cfg_accounts.items():
+
+    def process_account(name):
+        account = cfg_accounts[name]
         # print(account)
         # Account({name: "michael.smith@moonlightimagery.com", displayName: "Michael Smith", enabled: "True", firstName: "Michael", lastName: "Smith", size: "25600", visibleInExchangeGAL: "True", visibleInRackspaceEmailCompanyDirectory: "True"})
         # {"firstName": "Michael", "lastName": "Smith"}
@@ -120,14 +223,17 @@ def process_accounts(cfg_accounts, rs_accounts, domain):
             if len(diff):
                 account.update(diff)
 
-        if getattr(account, 'data') and 'spam' in account.data:
-            process_spam(account.api, account.data['spam'], name=name)
+        data = account.data
+        if data and 'spam' in data:
+            process_spam(account.api, data['spam'], name=name)
 
         store_account(account)
 
-    for name, account in rs_accounts.items():
-        if name not in cfg_accounts:
-            account.remove()
+    run_all(process_account, cfg_accounts)
+
+    # Removals ask for confirmation, one at a time on this thread
+    for name in sorted(rs_accounts.keys() - cfg_accounts.keys()):
+        rs_accounts[name].remove()
 
 def store_alias(alias, domain):
     email = '@'.join((alias.name, domain))
@@ -135,7 +241,9 @@ def store_alias(alias, domain):
 
 def process_aliases(cfg_aliases, rs_aliases, domain):
     print('- Aliases(process)')
-    for name, alias in cfg_aliases.items():
+
+    def process_alias(name):
+        alias = cfg_aliases[name]
 
         if name not in rs_aliases:
             alias.add()
@@ -147,9 +255,11 @@ def process_aliases(cfg_aliases, rs_aliases, domain):
 
         store_alias(alias, domain)
 
-    for name, alias in rs_aliases.items():
-        if name not in cfg_aliases:
-            alias.remove()
+    run_all(process_alias, cfg_aliases)
+
+    # Removals ask for confirmation, one at a time on this thread
+    for name in sorted(rs_aliases.keys() - cfg_aliases.keys()):
+        rs_aliases[name].remove()
 
 def store_spam(_type, account, data):
     if _type == 'settings':
@@ -158,7 +268,7 @@ def store_spam(_type, account, data):
     store(_type, account, data, SYNC_DIR, debug=DEBUG)
 
 def process_spam(api, data: dict, name: str =None):
-    account = f'{"" if name is None else f"{name}"}@{api.domain}'
+    account = ('' if name is None else name) + '@' + api.domain
 
     print(f'- Spam {account}')
 
@@ -169,20 +279,34 @@ def process_spam(api, data: dict, name: str =None):
         diff = cfg_spam.diff(rs_spam)
         cfg_spam.set(diff)
 
-    types = ('blocklist', 'safelist', 'ipblocklist', 'ipsafelist', 'settings')
-
-    spamdata = copy.deepcopy(data)
-    for stype in types:
-        if stype in spamdata:
-            sdata = spamdata.pop(stype)
+    # Only read from data, sorted() leaves the config lists alone
+    for stype in SPAM_TYPES:
+        if stype in data:
+            sdata = data[stype]
 
             if len(sdata):
                 if isinstance(sdata, list):
-                    sdata.sort()
+                    sdata = sorted(sdata)
 
                 store_spam(stype, account, sdata)
 
-def process_domain(domain, data, api):
+def fetch_domain(domain, data, api):
+    # Read only, the remote account and alias listings for the domain
+    api.set_domain(domain)
+
+    if 'accounts' not in data:
+        return None
+
+    print(f'- Accounts/Aliases(get) {domain}')
+
+    # Both listings are independent GETs, overlap their round trips
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        rs_accounts = pool.submit(contextvars.copy_context().run, lambda: Accounts(api, debug=DEBUG).get())
+        rs_aliases = pool.submit(contextvars.copy_context().run, lambda: Aliases(api, debug=DEBUG).get())
+
+    return rs_accounts.result(), rs_aliases.result()
+
+def process_domain(domain, data, api, remote):
     api.set_domain(domain)
 
     print(f'DOMAIN: {domain}')
@@ -191,21 +315,32 @@ def process_domain(domain, data, api):
         process_spam(api, data['spam'])
 
     if 'accounts' in data:
-        print('- Accounts/Aliases(get)')
         accounts, aliases = _init_accounts(domain, data['accounts'], api)
+        rs_accounts, rs_aliases = remote
 
-        process_accounts(accounts, Accounts(api, debug=DEBUG).get(), domain)
-        process_aliases(aliases, Aliases(api, debug=DEBUG).get(), domain)
+        process_accounts(accounts, rs_accounts, domain)
+        process_aliases(aliases, rs_aliases, domain)
 
 def sync(CONFIG):
-    api = Api(**CONFIG)
-
+    domains = []
     for domain, domain_cfg in CONFIG['domains'].items():
 
         if domain == 'XXXmoonlightimagery.com':
             continue
 
-        process_domain(domain, domain_cfg, api)
+        domains.append((domain, domain_cfg, Api(**CONFIG)))
+
+    if not domains:
+        return
+
+    # Only the read only listings overlap across domains.  Each domain
+    # gets its own Api, the current domain is part of its state
+    remotes = run_all(lambda args: fetch_domain(*args), domains, max_workers=DOMAIN_WORKERS)
+
+    # Changes run one domain at a time, so the progress output and the
+    # delete prompts stay grouped under their DOMAIN line
+    for (domain, domain_cfg, api), remote in zip(domains, remotes):
+        process_domain(domain, domain_cfg, api, remote)
 
 def wait_for_change(args, CONFIG):
     change_file = os.path.join(args.dir, ('changed'))
@@ -224,8 +359,18 @@ if __name__ == '__main__':
     parser.add_argument('--watch', '-w', default=False, action='store_true')
     parser.add_argument('--dir', '-d', default=CONFIG_DIR)
     parser.add_argument('--conf', '-c', default=CONFIG_FILE)
+    parser.add_argument('--verbose', '-v', default=False, action='store_true')
     args = parser.parse_args()
 
+    # Keep the output of concurrent run_all() items together, before
+    # logging is set up so its handler writes through it too
+    sys.stdout = ThreadOutput(sys.stdout)
+    sys.stderr = ThreadOutput(sys.stderr)
+
+    # --verbose brings back the request trace and error bodies, see Api.set_verbose()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
+    Api.set_verbose(args.verbose)
+
     if not os.path.exists(args.conf):
         args.conf = os.path.join(args.dir, args.conf)
 